@@ -1,4 +1,7 @@
+import asyncio
+import concurrent.futures
 import contextlib
+import functools
 from http import client
 import io
 import os
@@ -6,12 +9,40 @@ import socket
 import subprocess
 import sys
 import tempfile
-from typing import Callable, IO, Iterator, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    IO,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 import altair as alt
 
 from altair_saver.types import JSONDict
 
+T = TypeVar("T")
+
+
+def run_coro_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    When no event loop is running this is simply ``asyncio.run``. When called
+    from a thread that already hosts a running loop (e.g. a Jupyter kernel or
+    an async web server), the coroutine is run on a private loop in a worker
+    thread instead, since ``asyncio.run`` would raise a RuntimeError there.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
 
 def internet_connected(test_url: str = "cdn.jsdelivr.net") -> bool:
     """Return True if web connection is available."""
@@ -26,12 +57,17 @@ def internet_connected(test_url: str = "cdn.jsdelivr.net") -> bool:
         conn.close()
 
 
+@functools.lru_cache(32)
 def fmt_to_mimetype(
     fmt: str,
     vegalite_version: str = alt.VEGALITE_VERSION,
     vega_version: str = alt.VEGA_VERSION,
 ) -> str:
-    """Get a mimetype given a format string."""
+    """Get a mimetype given a format string.
+
+    Results are cached: the version-templated mimetypes would otherwise be
+    re-formatted on every mimebundle call.
+    """
     if fmt == "vega-lite":
         return "application/vnd.vegalite.v{}+json".format(
             vegalite_version.split(".")[0]
@@ -167,11 +203,26 @@ def extract_format(fp: Union[IO, str]) -> str:
         return filename.split(".")[-1]
 
 
+def display_stderr(
+    stderr: bytes, stderr_filter: Optional[Callable[[str], bool]] = None
+) -> None:
+    """Write captured subprocess stderr to sys.stderr, optionally filtered."""
+    s = stderr.decode()
+    if stderr_filter:
+        s = "\n".join(filter(stderr_filter, s.splitlines()))
+    if s:
+        if not s.endswith("\n"):
+            s += "\n"
+        sys.stderr.write(s)
+        sys.stderr.flush()
+
+
 def check_output_with_stderr(
     cmd: Union[str, List[str]],
     shell: bool = False,
     input: Optional[bytes] = None,
     stderr_filter: Callable[[str], bool] = None,
+    stdout: Optional[IO] = None,
 ) -> bytes:
     """Run a command in a subprocess, printing stderr to sys.stderr.
 
@@ -184,37 +235,85 @@ def check_output_with_stderr(
         Arguments are passed directly to `subprocess.run()`.
     stderr_filter : function(str)->bool (optional)
         If provided, this function is used to filter stderr lines from display.
+    stdout : binary file object (optional)
+        If provided, the command's output is streamed to this file rather than
+        captured, avoiding materializing large outputs in memory.
 
     Returns
     -------
     result : bytes
-        The stdout from the command
+        The stdout from the command, or b"" if ``stdout`` was provided.
 
     Raises
     ------
     subprocess.CalledProcessError : if the called process returns a non-zero exit code.
     """
+    stderr = b""
     try:
         ps = subprocess.run(
             cmd,
             shell=shell,
             input=input,
             check=True,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.PIPE if stdout is None else stdout,
             stderr=subprocess.PIPE,
+            # No inherited descriptors are needed by the child; skipping the
+            # fork-time fd scan saves measurable time when the parent process
+            # has many open files.
+            close_fds=False,
         )
     except subprocess.CalledProcessError as err:
         stderr = err.stderr
         raise
     else:
         stderr = ps.stderr
-        return ps.stdout
+        return ps.stdout if stdout is None else b""
+    finally:
+        display_stderr(stderr, stderr_filter)
+
+
+async def check_output_with_stderr_async(
+    cmd: List[str],
+    input: Optional[bytes] = None,
+    stderr_filter: Callable[[str], bool] = None,
+) -> bytes:
+    """Async counterpart of :func:`check_output_with_stderr`.
+
+    Running commands as asyncio subprocesses allows the event loop to overlap
+    several conversions rather than blocking on each one in turn.
+
+    Parameters
+    ----------
+    cmd : list of strings
+        The command to run; passed to `asyncio.create_subprocess_exec()`.
+    input : bytes (optional)
+        Content to send to the command's stdin.
+    stderr_filter : function(str)->bool (optional)
+        If provided, this function is used to filter stderr lines from display.
+
+    Returns
+    -------
+    result : bytes
+        The stdout from the command
+
+    Raises
+    ------
+    subprocess.CalledProcessError : if the called process returns a non-zero exit code.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate(input)
+    try:
+        returncode = proc.returncode
+        assert returncode is not None
+        if returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode, cmd, output=stdout, stderr=stderr
+            )
+        return stdout
     finally:
-        s = stderr.decode()
-        if stderr_filter:
-            s = "\n".join(filter(stderr_filter, s.splitlines()))
-        if s:
-            if not s.endswith("\n"):
-                s += "\n"
-            sys.stderr.write(s)
-            sys.stderr.flush()
+        display_stderr(stderr, stderr_filter)
@@ -0,0 +1,180 @@
+// Persistent worker process used by altair_saver's NodeSaver.
+//
+// The worker starts out reading one JSON request per line from stdin and
+// writing one JSON response per line to stdout. Requests have the form
+//     {"op": "vl2vg" | "vg2svg" | "vg2png" | "vg2pdf", "spec": {...}}
+// and responses the form
+//     {"result": ..., "stderr": [...]}  or  {"error": "...", "stderr": [...]}
+// In JSON mode binary results (png, pdf) are base64-encoded. Log output that
+// the one-shot CLIs would print to stderr is collected per-request and
+// returned in the "stderr" list so the Python side can filter and display it.
+//
+// A {"op": "upgrade", "encoding": "msgpack"} request switches both directions
+// to length-prefixed MessagePack frames (4-byte big-endian length + body),
+// provided a msgpack module is installed; binary results are then sent as raw
+// bytes with no base64 overhead. The upgrade response itself is sent as JSON.
+"use strict";
+
+const readline = require("readline");
+const vega = require("vega");
+const vegaLite = require("vega-lite");
+
+// A vega logger that collects messages rather than printing them.
+function makeLogger(lines) {
+  let level = vega.Warn;
+  const collect = (prefix) =>
+    function () {
+      lines.push(prefix + " " + Array.prototype.join.call(arguments, " "));
+      return this;
+    };
+  const logger = {
+    level: function (l) {
+      if (arguments.length) {
+        level = l;
+        return logger;
+      }
+      return level;
+    },
+    error: collect("ERROR"),
+    warn: collect("WARN"),
+    info: collect("INFO"),
+    debug: collect("DEBUG"),
+  };
+  return logger;
+}
+
+function toView(spec, logger) {
+  return new vega.View(vega.parse(spec), {
+    logger: logger,
+    renderer: "none",
+  }).finalize();
+}
+
+// Handlers return raw results; Buffers are base64-encoded only by the JSON
+// transport.
+const handlers = {
+  vl2vg: (spec, logger) =>
+    Promise.resolve(vegaLite.compile(spec, { logger: logger }).spec),
+  vg2svg: (spec, logger) => toView(spec, logger).toSVG(),
+  vg2png: (spec, logger) =>
+    toView(spec, logger)
+      .toCanvas()
+      .then((canvas) => canvas.toBuffer()),
+  vg2pdf: (spec, logger) =>
+    toView(spec, logger)
+      .toCanvas(1, { type: "pdf", context: { textDrawingMode: "glyph" } })
+      .then((canvas) => canvas.toBuffer()),
+};
+
+function handleRequest(request) {
+  const lines = [];
+  return Promise.resolve()
+    .then(() => {
+      const handler = handlers[request.op];
+      if (!handler) {
+        throw new Error("Unrecognized op: " + request.op);
+      }
+      return handler(request.spec, makeLogger(lines));
+    })
+    .then(
+      (result) => ({ result: result, stderr: lines }),
+      (error) => ({ error: String(error), stderr: lines })
+    );
+}
+
+function writeJsonResponse(response) {
+  if (Buffer.isBuffer(response.result)) {
+    response = Object.assign({}, response, {
+      result: response.result.toString("base64"),
+    });
+  }
+  process.stdout.write(JSON.stringify(response) + "\n");
+}
+
+function tryRequireMsgpack() {
+  for (const name of ["@msgpack/msgpack", "msgpack-lite"]) {
+    try {
+      const mod = require(name);
+      if (mod.encode && mod.decode) {
+        return mod;
+      }
+    } catch (error) {
+      // not installed; try the next candidate
+    }
+  }
+  return null;
+}
+
+// Length-prefixed MessagePack framing, entered via the "upgrade" op. The
+// Python side sends no further bytes until it has read the upgrade response,
+// so no line-mode input can be buffered when the switch happens.
+function msgpackLoop(codec) {
+  let buffer = Buffer.alloc(0);
+  let pending = Promise.resolve();
+
+  const writeResponse = (response) => {
+    const body = Buffer.from(codec.encode(response));
+    const header = Buffer.alloc(4);
+    header.writeUInt32BE(body.length, 0);
+    process.stdout.write(Buffer.concat([header, body]));
+  };
+
+  process.stdin.on("data", (chunk) => {
+    buffer = Buffer.concat([buffer, chunk]);
+    while (buffer.length >= 4) {
+      const size = buffer.readUInt32BE(0);
+      if (buffer.length < 4 + size) {
+        break;
+      }
+      const frame = buffer.slice(4, 4 + size);
+      buffer = buffer.slice(4 + size);
+      pending = pending.then(() =>
+        Promise.resolve()
+          .then(() => handleRequest(codec.decode(frame)))
+          .catch((error) => ({ error: String(error), stderr: [] }))
+          .then(writeResponse)
+      );
+    }
+  });
+  process.stdin.on("end", () => {
+    pending.then(() => process.exit(0));
+  });
+  // readline leaves stdin paused when it closes; resume it so the data
+  // listener above actually receives the msgpack frames.
+  process.stdin.resume();
+}
+
+// Requests are handled strictly in order, so that the nth response always
+// corresponds to the nth request.
+let upgraded = false;
+let pending = Promise.resolve();
+const rl = readline.createInterface({ input: process.stdin, terminal: false });
+rl.on("line", (line) => {
+  pending = pending.then(() => {
+    let request;
+    try {
+      request = JSON.parse(line);
+    } catch (error) {
+      writeJsonResponse({ error: String(error), stderr: [] });
+      return;
+    }
+    if (request.op === "upgrade") {
+      const codec = request.encoding === "msgpack" ? tryRequireMsgpack() : null;
+      writeJsonResponse({ result: codec !== null, stderr: [] });
+      if (codec !== null) {
+        upgraded = true;
+        rl.close();
+        msgpackLoop(codec);
+      }
+      return;
+    }
+    return handleRequest(request).then(writeJsonResponse);
+  });
+});
+rl.on("close", () => {
+  if (!upgraded) {
+    pending.then(() => process.exit(0));
+  }
+});
+
+process.stdout.write(JSON.stringify({ ready: true }) + "\n");
@@ -1,17 +1,66 @@
+import asyncio
+import atexit
+import base64
 import functools
+import io
 import json
+import os
 import shutil
-from typing import Any, Callable, Dict, List, Optional
+import subprocess
+import sys
+import threading
+from typing import Any, Callable, Dict, IO, List, Optional, Union
 
 from altair_saver.types import JSONDict, MimebundleContent
-from altair_saver._utils import check_output_with_stderr
+from altair_saver._utils import (
+    check_output_with_stderr,
+    check_output_with_stderr_async,
+    display_stderr,
+    extract_format,
+    maybe_open,
+    run_coro_sync,
+)
 from altair_saver.savers import Saver
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # type: ignore
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a JSON object directly to bytes.
+
+    Uses orjson when available; it is several times faster than the stdlib
+    on large nested specs and returns bytes without an intermediate str.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON object from a string or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class ExecutableNotFound(RuntimeError):
     pass
 
 
+class _WorkerError(RuntimeError):
+    """Raised internally when the persistent node worker cannot be used."""
+
+    pass
+
+
 @functools.lru_cache(2)
 def npm_bin(global_: bool) -> str:
     """Locate the npm binary directory."""
@@ -24,19 +73,302 @@ def npm_bin(global_: bool) -> str:
     return check_output_with_stderr(cmd).decode().strip()
 
 
+@functools.lru_cache(2)
+def npm_root(global_: bool) -> str:
+    """Locate the npm module root directory."""
+    npm = shutil.which("npm")
+    if not npm:
+        raise ExecutableNotFound("npm")
+    cmd = [npm, "root"]
+    if global_:
+        cmd.append("--global")
+    return check_output_with_stderr(cmd).decode().strip()
+
+
 @functools.lru_cache(16)
-def exec_path(name: str) -> str:
-    for path in [None, npm_bin(global_=True), npm_bin(global_=False)]:
+def _find_executable(name: str) -> Optional[str]:
+    """Search for an executable on PATH and in the npm binary directories.
+
+    Both hits and misses are cached: the result cannot change within a
+    process's lifetime, and an uncached miss would re-scan PATH (and re-run
+    ``npm bin``) on every ``NodeSaver.enabled()`` probe.
+    """
+    paths: List[Optional[str]] = [None]
+    try:
+        paths.extend([npm_bin(global_=True), npm_bin(global_=False)])
+    except (ExecutableNotFound, subprocess.CalledProcessError):
+        # npm is missing, or is a recent version without the `npm bin`
+        # command; fall back to searching PATH alone.
+        pass
+    for path in paths:
         exc = shutil.which(name, path=path)
         if exc:
             return exc
-    raise ExecutableNotFound(name)
+    return None
+
+
+def exec_path(name: str) -> str:
+    exc = _find_executable(name)
+    if not exc:
+        raise ExecutableNotFound(name)
+    return exc
 
 
 def _default_stderr_filter(line: str) -> bool:
     return line != "WARN Can not resolve event source: window"
 
 
+def _supports_streaming(fp: Union[IO, str]) -> bool:
+    """Return True if a subprocess can write to ``fp`` directly.
+
+    Filenames are opened as real files; file objects must expose a usable
+    file descriptor (in-memory buffers like io.BytesIO do not).
+    """
+    if isinstance(fp, str):
+        return True
+    if not hasattr(fp, "fileno"):
+        return False
+    try:
+        fp.fileno()
+    except (io.UnsupportedOperation, OSError):
+        return False
+    return True
+
+
+class _NodeWorker:
+    """A long-lived Node.js process that performs Vega/Vega-Lite conversions.
+
+    Starting a fresh Node.js interpreter for each conversion costs a few
+    hundred milliseconds of startup and module-loading time. This class keeps
+    a single worker process alive, sending it one JSON request per line on
+    stdin and reading one JSON response per line from stdout, so a sequence
+    of conversions pays the startup cost only once.
+    """
+
+    _DRIVER = os.path.normpath(
+        os.path.join(os.path.dirname(__file__), os.pardir, "js", "vega_worker.js")
+    )
+
+    _proc: Optional["subprocess.Popen[bytes]"]
+    _msgpack: bool
+
+    def __init__(self) -> None:
+        self._proc = None
+        self._msgpack = False
+        self._lock = threading.Lock()
+
+    def _start(self) -> "subprocess.Popen[bytes]":
+        node = shutil.which("node")
+        if not node:
+            raise ExecutableNotFound("node")
+        env = os.environ.copy()
+        try:
+            node_path = [npm_root(global_=False), npm_root(global_=True)]
+        except (ExecutableNotFound, subprocess.CalledProcessError):
+            # npm is missing or unusable; let node resolve modules from its
+            # default search path.
+            node_path = []
+        if env.get("NODE_PATH"):
+            node_path.append(env["NODE_PATH"])
+        if node_path:
+            env["NODE_PATH"] = os.pathsep.join(node_path)
+        proc = subprocess.Popen(
+            [node, self._DRIVER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+        )
+        atexit.register(self.stop)
+        assert proc.stdout is not None
+        line = proc.stdout.readline()
+        try:
+            ready = _loads(line) if line else {}
+        except ValueError:
+            ready = {}
+        if not ready.get("ready"):
+            proc.kill()
+            proc.wait()
+            raise _WorkerError("node worker failed to start")
+        self._msgpack = self._upgrade_transport(proc)
+        return proc
+
+    @staticmethod
+    def _upgrade_transport(proc: "subprocess.Popen[bytes]") -> bool:
+        """Negotiate the MessagePack transport, if available on both sides.
+
+        MessagePack frames are both smaller and cheaper to parse than JSON
+        lines for large specs, and binary results skip base64 entirely. If
+        either side lacks a msgpack module the worker stays in JSON mode.
+        """
+        if msgpack is None:
+            return False
+        assert proc.stdin is not None and proc.stdout is not None
+        try:
+            proc.stdin.write(_dumps({"op": "upgrade", "encoding": "msgpack"}) + b"\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline()
+            response = _loads(line) if line else {}
+        except (OSError, ValueError):
+            return False
+        return bool(response.get("result"))
+
+    def _write_message(self, stdin: Any, message: JSONDict) -> None:
+        if self._msgpack:
+            body = msgpack.packb(message)
+            stdin.write(len(body).to_bytes(4, "big") + body)
+        else:
+            stdin.write(_dumps(message) + b"\n")
+
+    def _read_message(self, stdout: Any) -> Optional[JSONDict]:
+        if self._msgpack:
+            header = stdout.read(4)
+            if len(header) < 4:
+                return None
+            size = int.from_bytes(header, "big")
+            body = stdout.read(size)
+            if len(body) < size:
+                return None
+            return msgpack.unpackb(body)
+        line = stdout.readline()
+        if not line:
+            return None
+        return _loads(line)
+
+    def _ensure_proc(self) -> "subprocess.Popen[bytes]":
+        if self._proc is None or self._proc.poll() is not None:
+            self.stop()
+            self._proc = self._start()
+        return self._proc
+
+    def warm_up(self) -> None:
+        """Start the worker process if it is not already running."""
+        with self._lock:
+            self._ensure_proc()
+
+    def _pipeline(self, messages: List[JSONDict]) -> List[JSONDict]:
+        """Send a sequence of requests, reading responses concurrently.
+
+        Responses are read in a background thread so that writing a large
+        batch of requests cannot deadlock against a full stdout pipe.
+        """
+        if not messages:
+            return []
+        with self._lock:
+            return self._pipeline_locked(messages)
+
+    def _pipeline_locked(self, messages: List[JSONDict]) -> List[JSONDict]:
+        proc = self._ensure_proc()
+        stdin, stdout = proc.stdin, proc.stdout
+        assert stdin is not None and stdout is not None
+        responses: List[JSONDict] = []
+
+        def _read() -> None:
+            for _ in messages:
+                try:
+                    response = self._read_message(stdout)
+                except ValueError:
+                    break
+                if response is None:
+                    break
+                responses.append(response)
+
+        reader = threading.Thread(target=_read)
+        reader.start()
+        try:
+            for message in messages:
+                self._write_message(stdin, message)
+            stdin.flush()
+        finally:
+            reader.join()
+        if len(responses) < len(messages):
+            raise _WorkerError("node worker exited unexpectedly")
+        return responses
+
+    def _handle_response(
+        self,
+        response: JSONDict,
+        op: str,
+        stderr_filter: Optional[Callable[[str], bool]],
+    ) -> Any:
+        stderr = response.get("stderr", [])
+        assert isinstance(stderr, list)
+        if stderr_filter:
+            stderr = list(filter(stderr_filter, stderr))
+        s = "\n".join(stderr)
+        if s:
+            sys.stderr.write(s + "\n")
+            sys.stderr.flush()
+        if "error" in response:
+            raise subprocess.CalledProcessError(
+                1, [op], output=b"", stderr=str(response["error"]).encode()
+            )
+        return response["result"]
+
+    def call(
+        self,
+        op: str,
+        spec: JSONDict,
+        stderr_filter: Optional[Callable[[str], bool]] = None,
+    ) -> Any:
+        """Perform a single conversion via the worker process.
+
+        Parameters
+        ----------
+        op : string
+            The operation to perform; one of "vl2vg", "vg2svg", "vg2png",
+            or "vg2pdf".
+        spec : dict
+            The vega or vega-lite specification to convert.
+        stderr_filter : function(str)->bool (optional)
+            If provided, this function is used to filter log lines from display.
+
+        Returns
+        -------
+        result :
+            The conversion result; binary formats are base64-encoded strings.
+
+        Raises
+        ------
+        _WorkerError : if communication with the worker process fails.
+        subprocess.CalledProcessError : if the conversion itself fails.
+        """
+        return self.call_many(op, [spec], stderr_filter=stderr_filter)[0]
+
+    def call_many(
+        self,
+        op: str,
+        specs: List[JSONDict],
+        stderr_filter: Optional[Callable[[str], bool]] = None,
+    ) -> List[Any]:
+        """Perform a batch of conversions, pipelined through the worker.
+
+        All requests are written back-to-back and the responses collected in
+        order, so an N-chart batch costs a single round-trip rather than N
+        process startups.
+
+        Parameters, return values, and exceptions are as for :meth:`call`,
+        except that ``specs`` and the result are lists.
+        """
+        try:
+            responses = self._pipeline([{"op": op, "spec": spec} for spec in specs])
+        except (OSError, ValueError) as err:
+            self.stop()
+            raise _WorkerError(str(err))
+        return [
+            self._handle_response(response, op, stderr_filter) for response in responses
+        ]
+
+    def stop(self) -> None:
+        """Terminate the worker process if it is running."""
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.poll() is None:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.terminate()
+            proc.wait()
+
+
 class NodeSaver(Saver):
 
     valid_formats: Dict[str, List[str]] = {
@@ -46,6 +378,17 @@ class NodeSaver(Saver):
     _vega_cli_options: List[str]
     _stderr_filter: Optional[Callable[[str], bool]]
 
+    # A persistent worker process shared by all instances; None until first
+    # used. If the worker cannot be started, _worker_broken is set and all
+    # conversions use the one-shot CLI path instead.
+    _worker: Optional[_NodeWorker] = None
+    _worker_broken: bool = False
+
+    # Dispatch table mapping output format to converter method. The "vega"
+    # format stays an explicit branch since it returns the compiled spec
+    # directly rather than invoking a converter.
+    _CONVERTERS: Dict[str, str] = {"png": "_vg2png", "svg": "_vg2svg", "pdf": "_vg2pdf"}
+
     def __init__(
         self,
         spec: JSONDict,
@@ -56,21 +399,61 @@ class NodeSaver(Saver):
     ) -> None:
         self._vega_cli_options = vega_cli_options or []
         self._stderr_filter = stderr_filter
+        # True once a piped vl2vg|vg2* conversion has run; later conversions
+        # of this instance then use the cached compiled spec instead of
+        # re-compiling inside another pipeline.
+        self._pipelined = False
         super().__init__(spec=spec, mode=mode, **kwargs)
 
+    @classmethod
+    def _get_worker(cls) -> Optional[_NodeWorker]:
+        """Return the shared node worker, or None if it is unavailable."""
+        if cls._worker_broken or os.environ.get("ALTAIR_SAVER_NO_NODE_WORKER"):
+            return None
+        if cls._worker is None:
+            cls._worker = _NodeWorker()
+        return cls._worker
+
+    def _worker_call(self, op: str, spec: JSONDict) -> Optional[Any]:
+        """Attempt a conversion via the persistent worker.
+
+        Returns None if the worker is unavailable, in which case the caller
+        should fall back to the one-shot CLI path.
+        """
+        worker = self._get_worker()
+        if worker is None:
+            return None
+        try:
+            return worker.call(op, spec, stderr_filter=self._stderr_filter)
+        except _WorkerError:
+            NodeSaver._worker_broken = True
+            NodeSaver._worker = None
+            return None
+
     def _vl2vg(self, spec: JSONDict) -> JSONDict:
         """Compile a Vega-Lite spec into a Vega spec."""
+        result = self._worker_call("vl2vg", spec)
+        if result is not None:
+            assert isinstance(result, dict)
+            return result
         vl2vg = exec_path("vl2vg")
-        vl_json = json.dumps(spec).encode()
+        vl_json = _dumps(spec)
         vg_json = check_output_with_stderr(
             [vl2vg], input=vl_json, stderr_filter=self._stderr_filter
         )
-        return json.loads(vg_json)
+        return _loads(vg_json)
 
     def _vg2png(self, spec: JSONDict) -> bytes:
         """Generate a PNG image from a Vega spec."""
+        if not self._vega_cli_options:
+            result = self._worker_call("vg2png", spec)
+            if isinstance(result, bytes):
+                return result
+            if result is not None:
+                assert isinstance(result, str)
+                return base64.b64decode(result)
         vg2png = exec_path("vg2png")
-        vg_json = json.dumps(spec).encode()
+        vg_json = _dumps(spec)
         return check_output_with_stderr(
             [vg2png, *(self._vega_cli_options or [])],
             input=vg_json,
@@ -79,8 +462,15 @@ class NodeSaver(Saver):
 
     def _vg2pdf(self, spec: JSONDict) -> bytes:
         """Generate a PDF image from a Vega spec."""
+        if not self._vega_cli_options:
+            result = self._worker_call("vg2pdf", spec)
+            if isinstance(result, bytes):
+                return result
+            if result is not None:
+                assert isinstance(result, str)
+                return base64.b64decode(result)
         vg2pdf = exec_path("vg2pdf")
-        vg_json = json.dumps(spec).encode()
+        vg_json = _dumps(spec)
         return check_output_with_stderr(
             [vg2pdf, *(self._vega_cli_options or [])],
             input=vg_json,
@@ -89,8 +479,13 @@ class NodeSaver(Saver):
 
     def _vg2svg(self, spec: JSONDict) -> str:
         """Generate an SVG image from a Vega spec."""
+        if not self._vega_cli_options:
+            result = self._worker_call("vg2svg", spec)
+            if result is not None:
+                assert isinstance(result, str)
+                return result
         vg2svg = exec_path("vg2svg")
-        vg_json = json.dumps(spec).encode()
+        vg_json = _dumps(spec)
         return check_output_with_stderr(
             [vg2svg, *(self._vega_cli_options or [])],
             input=vg_json,
@@ -104,22 +499,277 @@ class NodeSaver(Saver):
         except ExecutableNotFound:
             return False
 
-    def _serialize(self, fmt: str, content_type: str) -> MimebundleContent:
-        if self._mode not in ["vega", "vega-lite"]:
-            raise ValueError("mode must be either 'vega' or 'vega-lite'")
+    @classmethod
+    def save_many(
+        cls,
+        specs: List[JSONDict],
+        fmt: str,
+        mode: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[MimebundleContent]:
+        """Convert a batch of chart specifications in a single worker round-trip.
 
-        spec = self._spec
+        This amortizes Node.js startup across the batch: all conversions are
+        pipelined through the shared worker process rather than spawning a
+        subprocess per chart.
+
+        Parameters
+        ----------
+        specs : list of dict
+            The vega or vega-lite specifications to convert.
+        fmt : string
+            The format to which the specs will be converted; one of
+            ["pdf", "png", "svg", "vega"].
+        mode : string (optional)
+            The mode of the input specs: either "vega" or "vega-lite". If not
+            specified, it is inferred separately for each spec.
+        **kwargs :
+            Additional keyword arguments are passed to Saver initialization.
+
+        Returns
+        -------
+        results : list
+            The converted charts, in the order of ``specs``.
+        """
+        savers = cls._make_savers(specs, fmt, mode=mode, **kwargs)
+        worker = cls._get_worker()
+        if worker is not None and not kwargs.get("vega_cli_options"):
+            try:
+                return cls._save_many_worker(worker, savers, fmt)
+            except _WorkerError:
+                cls._worker_broken = True
+                cls._worker = None
+        return run_coro_sync(cls._gather_async(savers, fmt))
+
+    @classmethod
+    async def save_many_async(
+        cls,
+        specs: List[JSONDict],
+        fmt: str,
+        mode: Optional[str] = None,
+        max_concurrency: int = 8,
+        **kwargs: Any,
+    ) -> List[MimebundleContent]:
+        """Convert a batch of chart specifications concurrently.
+
+        Each conversion runs as an asyncio subprocess, so the event loop can
+        overlap the node-side work of up to ``max_concurrency`` charts.
+        Parameters and return values are as for :meth:`save_many`.
+        """
+        savers = cls._make_savers(specs, fmt, mode=mode, **kwargs)
+        return await cls._gather_async(savers, fmt, max_concurrency=max_concurrency)
+
+    @classmethod
+    def _make_savers(
+        cls, specs: List[JSONDict], fmt: str, mode: Optional[str], **kwargs: Any
+    ) -> List["NodeSaver"]:
+        savers = [cls(spec, mode=mode, **kwargs) for spec in specs]
+        for saver in savers:
+            if fmt not in saver.valid_formats[saver._mode]:
+                raise ValueError(
+                    f"invalid fmt={fmt!r}; must be one of "
+                    f"{saver.valid_formats[saver._mode]}."
+                )
+        return savers
+
+    @classmethod
+    async def _gather_async(
+        cls, savers: List["NodeSaver"], fmt: str, max_concurrency: int = 8
+    ) -> List[MimebundleContent]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _convert(saver: "NodeSaver") -> MimebundleContent:
+            async with semaphore:
+                return await saver._serialize_async(fmt)
 
+        return list(await asyncio.gather(*(_convert(saver) for saver in savers)))
+
+    @classmethod
+    def _save_many_worker(
+        cls, worker: _NodeWorker, savers: List["NodeSaver"], fmt: str
+    ) -> List[MimebundleContent]:
+        stderr_filter = savers[0]._stderr_filter if savers else None
+        specs = [saver._spec for saver in savers]
+        vl_indices = [i for i, saver in enumerate(savers) if saver._mode == "vega-lite"]
+        if vl_indices:
+            compiled = worker.call_many(
+                "vl2vg", [specs[i] for i in vl_indices], stderr_filter=stderr_filter
+            )
+            for i, vg_spec in zip(vl_indices, compiled):
+                specs[i] = vg_spec
+        if fmt == "vega":
+            return list(specs)
+        results = worker.call_many(f"vg2{fmt}", specs, stderr_filter=stderr_filter)
+        if fmt in ("png", "pdf"):
+            return [
+                result if isinstance(result, bytes) else base64.b64decode(result)
+                for result in results
+            ]
+        return list(results)
+
+    def save(
+        self, fp: Optional[Union[IO, str]] = None, fmt: Optional[str] = None
+    ) -> Optional[Union[str, bytes]]:
+        """Save a chart to file, streaming binary formats when possible.
+
+        When saving png or pdf output to a file via the one-shot CLIs, the
+        CLI's stdout is connected directly to the file, so the image is never
+        materialized as an in-memory bytes object. Parameters and return
+        values are as for :meth:`Saver.save`.
+        """
+        if fp is not None:
+            if fmt is None:
+                fmt = extract_format(fp)
+            if (
+                fmt in ("png", "pdf")
+                and fmt in self.valid_formats[self._mode]
+                and (self._get_worker() is None or self._vega_cli_options)
+                and _supports_streaming(fp)
+            ):
+                cmd = [exec_path(f"vg2{fmt}"), *self._vega_cli_options]
+                with maybe_open(fp, "wb") as f:
+                    check_output_with_stderr(
+                        cmd,
+                        input=_dumps(self._vg_spec),
+                        stderr_filter=self._stderr_filter,
+                        stdout=f,
+                    )
+                return None
+        return super().save(fp, fmt)
+
+    @functools.cached_property
+    def _vg_spec(self) -> JSONDict:
+        """The spec compiled to Vega, computed on first access.
+
+        Saving the same chart in several formats (e.g. png and svg and pdf)
+        then runs the expensive Vega-Lite compilation only once. After the
+        first access this is a plain attribute lookup with no wrapper call.
+        """
         if self._mode == "vega-lite":
-            spec = self._vl2vg(spec)
+            return self._vl2vg(self._spec)
+        return self._spec
+
+    async def _serialize_async(self, fmt: str) -> MimebundleContent:
+        """Async counterpart of ``_serialize``.
 
+        This path always uses the one-shot CLIs as asyncio subprocesses (the
+        persistent worker is a synchronous pipe), so that several conversions
+        can be overlapped on one event loop.
+        """
+        spec = self._spec
+        if self._mode == "vega-lite":
+            if "_vg_spec" not in self.__dict__:
+                vl2vg = exec_path("vl2vg")
+                vg_json = await check_output_with_stderr_async(
+                    [vl2vg], input=_dumps(spec), stderr_filter=self._stderr_filter
+                )
+                # Seed the cached property so the sync path reuses the result.
+                self._vg_spec = _loads(vg_json)
+            spec = self._vg_spec
         if fmt == "vega":
             return spec
-        elif fmt == "png":
-            return self._vg2png(spec)
-        elif fmt == "svg":
-            return self._vg2svg(spec)
-        elif fmt == "pdf":
-            return self._vg2pdf(spec)
-        else:
+        elif fmt not in ("png", "svg", "pdf"):
+            raise ValueError(f"Unrecognized format: {fmt!r}")
+        cmd = [exec_path(f"vg2{fmt}"), *self._vega_cli_options]
+        out = await check_output_with_stderr_async(
+            cmd, input=_dumps(spec), stderr_filter=self._stderr_filter
+        )
+        return out.decode() if fmt == "svg" else out
+
+    def _vl2fmt_pipeline(self, fmt: str) -> bytes:
+        """Convert a Vega-Lite spec straight to ``fmt`` with piped CLIs.
+
+        The vl2vg output is connected to the vg2* input at the kernel level,
+        so the intermediate Vega JSON flows between the two Node.js processes
+        without ever being parsed or re-serialized in Python.
+        """
+        cmd1 = [exec_path("vl2vg")]
+        cmd2 = [exec_path(f"vg2{fmt}"), *self._vega_cli_options]
+        p1 = subprocess.Popen(
+            cmd1,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False,
+        )
+        p2 = subprocess.Popen(
+            cmd2,
+            stdin=p1.stdout,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False,
+        )
+        assert p1.stdin is not None and p1.stdout is not None
+        assert p1.stderr is not None
+        # Close our copy of the intermediate pipe so p2 sees EOF when p1 exits.
+        p1.stdout.close()
+        # Drain p1's stderr on a thread while p2 runs: if p1 emits more than a
+        # pipe buffer of warnings it would otherwise block mid-conversion and
+        # never close its stdout, deadlocking against p2.
+        stderr1: List[bytes] = []
+        reader = threading.Thread(
+            target=lambda: stderr1.append(p1.stderr.read()), daemon=True  # type: ignore
+        )
+        reader.start()
+        p1.stdin.write(_dumps(self._spec))
+        p1.stdin.close()
+        out, err2 = p2.communicate()
+        reader.join()
+        err1 = stderr1[0] if stderr1 else b""
+        p1.stderr.close()
+        p1.wait()
+        try:
+            if p1.returncode != 0:
+                raise subprocess.CalledProcessError(
+                    p1.returncode, cmd1, output=b"", stderr=err1
+                )
+            if p2.returncode != 0:
+                raise subprocess.CalledProcessError(
+                    p2.returncode, cmd2, output=out, stderr=err2
+                )
+            return out
+        finally:
+            display_stderr(err1 + err2, self._stderr_filter)
+
+    def _serialize(self, fmt: str, content_type: str) -> MimebundleContent:
+        # The mode was already validated in Saver.__init__.
+        if (
+            fmt in ("png", "svg", "pdf")
+            and self._mode == "vega-lite"
+            and "_vg_spec" not in self.__dict__
+            and not self._pipelined
+            and self._get_worker() is None
+        ):
+            out = self._vl2fmt_pipeline(fmt)
+            self._pipelined = True
+            return out.decode() if fmt == "svg" else out
+
+        spec = self._vg_spec
+
+        if fmt == "vega":
+            return spec
+        method = self._CONVERTERS.get(fmt)
+        if method is None:
             raise ValueError(f"Unrecognized format: {fmt!r}")
+        return getattr(self, method)(spec)
+
+
+def _prewarm() -> None:
+    """Warm up executable resolution and the worker process.
+
+    Run in a background thread at import time when ALTAIR_SAVER_PREWARM is
+    set, so the first save() call does not pay npm lookup or Node.js startup
+    latency.
+    """
+    try:
+        _find_executable("vl2vg")
+        _find_executable("vg2png")
+        worker = NodeSaver._get_worker()
+        if worker is not None:
+            worker.warm_up()
+    except Exception:
+        pass
+
+
+if os.environ.get("ALTAIR_SAVER_PREWARM"):
+    threading.Thread(target=_prewarm, daemon=True).start()
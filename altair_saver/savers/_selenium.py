@@ -1,7 +1,10 @@
 import atexit
 import base64
+import json
 import os
-from typing import Any, Dict, List, Optional, Union
+import string
+import threading
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 import warnings
 
 import altair as alt
@@ -36,11 +39,33 @@ HTML_TEMPLATE = """
 </html>
 """
 
-EXTRACT_CODE = """
+# Offline variant with the javascript bundles included inline, so that the
+# page renders from a single fetch with no follow-up script requests.
+INLINE_HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+  <title>Embedding Vega-Lite</title>
+  <script>{vega_script}</script>
+  <script>{vegalite_script}</script>
+  <script>{vegaembed_script}</script>
+</head>
+<body>
+  <div id="vis"></div>
+</body>
+</html>
+"""
+
+# Template for the extraction script. The embed options (including mode) are
+# identical for every render of a given saver, so they are baked into the
+# script as a literal at saver initialization; the browser then receives one
+# fewer argument per call and can constant-fold the mode branch.
+EXTRACT_CODE_TEMPLATE = string.Template(
+    """
 let spec = arguments[0];
-const embedOpt = arguments[1];
-const format = arguments[2];
-const done = arguments[3];
+const format = arguments[1];
+const done = arguments[2];
+const embedOpt = $embed_opt;
 
 if (format === 'vega') {
     if (embedOpt.mode === 'vega-lite') {
@@ -83,6 +108,7 @@ vegaEmbed('#vis', spec, embedOpt).then(function(result) {
     done({error: err.toString()});
 });
 """
+)
 
 
 class _DriverRegistry:
@@ -158,6 +184,16 @@ class SeleniumSaver(Saver):
     _registry: _DriverRegistry = _DriverRegistry()
     _provider: Optional[Provider] = None
     _resources: Dict[str, Resource] = {}
+    # The key and URL of the most recently served content, so repeated
+    # renders of a chart with identical HTML and javascript do not re-create
+    # resources. Only the last entry is cached, because all chart pages are
+    # served from the provider's root route.
+    _last_served: Optional[Tuple[Tuple[str, FrozenSet[Tuple[str, str]]], str]] = None
+    # The driver and URL of the most recently loaded rendering page. When a
+    # driver is already sitting on the page being requested, navigation (and
+    # the script re-load it implies) is skipped and rendering is a single
+    # script execution on the warm page.
+    _last_loaded: Optional[Tuple[WebDriver, str]] = None
 
     def __init__(
         self,
@@ -190,6 +226,14 @@ class SeleniumSaver(Saver):
             vegaembed_version=vegaembed_version,
             **kwargs,
         )
+        # Invariants hoisted out of the per-chart extraction path: the embed
+        # options passed to the page and the rendering page itself are the
+        # same for every render of this saver.
+        self._opt: JSONDict = dict(self._embed_options, mode=self._mode)
+        self._extract_code = EXTRACT_CODE_TEMPLATE.substitute(
+            embed_opt=json.dumps(self._opt)
+        )
+        self._page: Optional[Tuple[str, Dict[str, str]]] = None
 
     @classmethod
     def _select_webdriver(cls, driver_timeout: int) -> Optional[str]:
@@ -212,6 +256,13 @@ class SeleniumSaver(Saver):
 
     @classmethod
     def _serve(cls, content: str, js_resources: Dict[str, str]) -> str:
+        key = (content, frozenset(js_resources.items()))
+        if cls._last_served is not None and cls._last_served[0] == key:
+            return cls._last_served[1]
+        # New content replaces what the provider serves at the root route, so
+        # the URL alone cannot distinguish it: any driver sitting on that URL
+        # is now showing stale content and must re-navigate.
+        cls._last_loaded = None
         if cls._provider is None:
             cls._provider = Provider()
         resource = cls._provider.create(
@@ -220,6 +271,7 @@ class SeleniumSaver(Saver):
         cls._resources[resource.url] = resource
         for route, content in js_resources.items():
             cls._resources[route] = cls._provider.create(content=content, route=route,)
+        cls._last_served = (key, resource.url)
         return resource.url
 
     @classmethod
@@ -227,24 +279,23 @@ class SeleniumSaver(Saver):
         if cls._provider is not None:
             cls._provider.stop()
             cls._provider = None
+            cls._last_served = None
+            cls._last_loaded = None
 
-    def _extract(self, fmt: str) -> MimebundleContent:
-        driver = self._registry.get(self._webdriver, self._driver_timeout)
-
+    def _build_page(self) -> Tuple[str, Dict[str, str]]:
+        """Return the HTML page and javascript resources used for rendering."""
+        if self._page is not None:
+            return self._page
         if self._offline:
-            js_resources = {
-                "vega.js": get_bundled_script("vega", self._package_versions["vega"]),
-                "vega-lite.js": get_bundled_script(
+            js_resources: Dict[str, str] = {}
+            html = INLINE_HTML_TEMPLATE.format(
+                vega_script=get_bundled_script("vega", self._package_versions["vega"]),
+                vegalite_script=get_bundled_script(
                     "vega-lite", self._package_versions["vega-lite"]
                 ),
-                "vega-embed.js": get_bundled_script(
+                vegaembed_script=get_bundled_script(
                     "vega-embed", self._package_versions["vega-embed"]
                 ),
-            }
-            html = HTML_TEMPLATE.format(
-                vega_url="/vega.js",
-                vegalite_url="/vega-lite.js",
-                vegaembed_url="/vega-embed.js",
             )
         else:
             js_resources = {}
@@ -259,8 +310,15 @@ class SeleniumSaver(Saver):
                     package="vega-embed", version=self._package_versions["vega-embed"]
                 ),
             )
+        self._page = (html, js_resources)
+        return self._page
 
+    def _load_page(self, driver: WebDriver, fmt: str) -> None:
+        """Serve the rendering page and navigate the driver to it."""
+        html, js_resources = self._build_page()
         url = self._serve(html, js_resources)
+        if SeleniumSaver._last_loaded == (driver, url):
+            return
         driver.get("about:blank")
         driver.get(url)
         try:
@@ -273,21 +331,95 @@ class SeleniumSaver(Saver):
                 raise RuntimeError(
                     f"Internet connection required for saving chart as {fmt} with offline=False."
                 )
-        opt = self._embed_options.copy()
-        opt["mode"] = self._mode
-        result = driver.execute_async_script(EXTRACT_CODE, self._spec, opt, fmt)
+        SeleniumSaver._last_loaded = (driver, url)
+
+    def _extract_on_page(self, driver: WebDriver, fmt: str) -> MimebundleContent:
+        """Render the chart on an already-loaded page."""
+        result = driver.execute_async_script(self._extract_code, self._spec, fmt)
         if "error" in result:
             raise JavascriptError(result["error"])
         return result["result"]
 
-    def _serialize(self, fmt: str, content_type: str) -> MimebundleContent:
-        out = self._extract(fmt)
+    def _extract(self, fmt: str) -> MimebundleContent:
+        driver = self._registry.get(self._webdriver, self._driver_timeout)
+        self._load_page(driver, fmt)
+        return self._extract_on_page(driver, fmt)
+
+    def _decode(self, out: MimebundleContent, fmt: str) -> MimebundleContent:
         if fmt == "png":
             assert isinstance(out, str)
-            return base64.b64decode(out.split(",", 1)[1].encode())
+            # Slice off the "data:image/png;base64," prefix and decode the
+            # str directly, avoiding two full-size intermediate copies.
+            return base64.b64decode(out[out.index(",") + 1 :])
         elif fmt == "svg":
             return out
         elif fmt == "vega":
             return out
         else:
             raise ValueError(f"Unrecognized format: {fmt}")
+
+    @classmethod
+    def save_many(
+        cls,
+        specs: List[JSONDict],
+        fmt: str,
+        mode: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[MimebundleContent]:
+        """Render a batch of chart specifications on a single loaded page.
+
+        The rendering page is served and loaded once for the whole batch, so
+        each additional chart costs only a single script execution on the warm
+        driver rather than a full page navigation and script load.
+
+        Parameters
+        ----------
+        specs : list of dict
+            The vega or vega-lite specifications to render.
+        fmt : string
+            The format to which the specs will be converted; one of
+            ["png", "svg", "vega"].
+        mode : string (optional)
+            The mode of the input specs: either "vega" or "vega-lite". If not
+            specified, it is inferred separately for each spec.
+        **kwargs :
+            Additional keyword arguments are passed to Saver initialization.
+
+        Returns
+        -------
+        results : list
+            The rendered charts, in the order of ``specs``.
+        """
+        savers = [cls(spec, mode=mode, **kwargs) for spec in specs]
+        for saver in savers:
+            if fmt not in saver.valid_formats[saver._mode]:
+                raise ValueError(
+                    f"invalid fmt={fmt!r}; must be one of "
+                    f"{saver.valid_formats[saver._mode]}."
+                )
+        if not savers:
+            return []
+        driver = cls._registry.get(savers[0]._webdriver, savers[0]._driver_timeout)
+        savers[0]._load_page(driver, fmt)
+        return [
+            saver._decode(saver._extract_on_page(driver, fmt), fmt) for saver in savers
+        ]
+
+    def _serialize(self, fmt: str, content_type: str) -> MimebundleContent:
+        return self._decode(self._extract(fmt), fmt)
+
+
+def _prewarm() -> None:
+    """Launch a webdriver ahead of the first save.
+
+    Run in a background thread at import time when ALTAIR_SAVER_PREWARM is
+    set, so the first save() call does not pay browser startup latency.
+    """
+    try:
+        SeleniumSaver.enabled()
+    except Exception:
+        pass
+
+
+if os.environ.get("ALTAIR_SAVER_PREWARM"):
+    threading.Thread(target=_prewarm, daemon=True).start()
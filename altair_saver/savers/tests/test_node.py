@@ -1,6 +1,8 @@
 import io
 import json
 import os
+import pathlib
+import shutil
 from typing import Any, Dict, IO, Iterator, List, Optional, Tuple
 
 from PIL import Image
@@ -110,6 +112,325 @@ def test_enabled(monkeypatch: MonkeyPatch, enabled: bool) -> None:
     assert NodeSaver.enabled() is enabled
 
 
+def test_vl2vg_memoized(monkeypatch: MonkeyPatch) -> None:
+    calls: List[JSONDict] = []
+
+    def fake_vl2vg(self: NodeSaver, spec: JSONDict) -> JSONDict:
+        calls.append(spec)
+        return {"compiled": True}
+
+    monkeypatch.setattr(NodeSaver, "_vl2vg", fake_vl2vg)
+    saver = NodeSaver({"mark": "point"})
+    assert saver._serialize("vega", "save") == {"compiled": True}
+    assert saver._serialize("vega", "save") == {"compiled": True}
+    assert len(calls) == 1
+
+
+def test_save_streams_png_to_file(
+    tmp_path: pathlib.Path, monkeypatch: MonkeyPatch
+) -> None:
+    # With the worker disabled, binary formats are streamed from the CLI's
+    # stdout directly to the file; `cat` stands in for vg2png.
+    monkeypatch.setenv("ALTAIR_SAVER_NO_NODE_WORKER", "1")
+    monkeypatch.setattr(_node, "exec_path", lambda name: "cat")
+    spec: JSONDict = {"data": [], "marks": []}
+    saver = NodeSaver(spec, mode="vega")
+    filename = str(tmp_path / "chart.png")
+    with open(filename, "wb") as fp:
+        assert saver.save(fp, fmt="png") is None
+    with open(filename, "rb") as fp:
+        assert json.load(fp) == spec
+
+
+def test_save_png_to_buffer(monkeypatch: MonkeyPatch) -> None:
+    # In-memory buffers have no file descriptor, so saving to one must fall
+    # back to the captured-output path rather than streaming.
+    monkeypatch.setenv("ALTAIR_SAVER_NO_NODE_WORKER", "1")
+    monkeypatch.setattr(_node, "exec_path", lambda name: "cat")
+    spec: JSONDict = {"data": [], "marks": []}
+    saver = NodeSaver(spec, mode="vega")
+    buf = io.BytesIO()
+    assert saver.save(buf, fmt="png") is None
+    assert json.loads(buf.getvalue()) == spec
+
+
+def test_vl2fmt_pipeline(monkeypatch: MonkeyPatch) -> None:
+    # With the worker disabled, vega-lite conversions pipe vl2vg into vg2*
+    # without a Python round-trip; `cat` stands in for both CLIs.
+    monkeypatch.setenv("ALTAIR_SAVER_NO_NODE_WORKER", "1")
+    monkeypatch.setattr(_node, "exec_path", lambda name: "cat")
+    spec: JSONDict = {"mark": "point"}
+    saver = NodeSaver(spec, mode="vega-lite")
+    out = saver._serialize("png", "save")
+    assert isinstance(out, bytes)
+    assert json.loads(out) == spec
+
+
+def test_vl2fmt_pipeline_large_stderr(
+    tmp_path: pathlib.Path, monkeypatch: MonkeyPatch, capsys: SysCapture
+) -> None:
+    # A CLI emitting more warnings than a pipe buffer holds must not
+    # deadlock the pipeline.
+    monkeypatch.setenv("ALTAIR_SAVER_NO_NODE_WORKER", "1")
+    script = tmp_path / "noisy"
+    script.write_text(
+        "#!/bin/sh\n"
+        "i=0\n"
+        "while [ $i -lt 2000 ]; do\n"
+        '  echo "WARN a long warning line to overflow the stderr pipe" >&2\n'
+        "  i=$((i+1))\n"
+        "done\n"
+        "cat\n"
+    )
+    script.chmod(0o755)
+    monkeypatch.setattr(_node, "exec_path", lambda name: str(script))
+    spec: JSONDict = {"mark": "point"}
+    saver = NodeSaver(spec, mode="vega-lite", stderr_filter=lambda line: False)
+    out = saver._serialize("png", "save")
+    assert isinstance(out, bytes)
+    assert json.loads(out) == spec
+    assert capsys.readouterr().err == ""
+
+
+def test_vl2fmt_pipeline_runs_once(monkeypatch: MonkeyPatch) -> None:
+    # Converting the same saver to several formats pipes only the first
+    # conversion; later ones reuse the cached compiled spec.
+    monkeypatch.setenv("ALTAIR_SAVER_NO_NODE_WORKER", "1")
+    monkeypatch.setattr(_node, "exec_path", lambda name: "cat")
+
+    piped: List[str] = []
+    pipeline = NodeSaver._vl2fmt_pipeline
+
+    def counting_pipeline(self: NodeSaver, fmt: str) -> bytes:
+        piped.append(fmt)
+        return pipeline(self, fmt)
+
+    compiled: List[JSONDict] = []
+
+    def fake_vl2vg(self: NodeSaver, spec: JSONDict) -> JSONDict:
+        compiled.append(spec)
+        return dict(spec)
+
+    monkeypatch.setattr(NodeSaver, "_vl2fmt_pipeline", counting_pipeline)
+    monkeypatch.setattr(NodeSaver, "_vl2vg", fake_vl2vg)
+
+    saver = NodeSaver({"mark": "point"}, mode="vega-lite")
+    saver._serialize("png", "save")
+    saver._serialize("svg", "save")
+    saver._serialize("pdf", "save")
+    assert piped == ["png"]
+    assert len(compiled) == 1
+
+
+# A stand-in for vega_worker.js that echoes the spec back, used to test the
+# worker transport without requiring the vega npm packages.
+ECHO_DRIVER = """
+process.stdout.write(JSON.stringify({ready: true}) + "\\n");
+const readline = require("readline");
+const rl = readline.createInterface({input: process.stdin, terminal: false});
+rl.on("line", (line) => {
+  const request = JSON.parse(line);
+  const response = request.op === "fail"
+    ? {error: "bad op", stderr: ["ERROR bad op"]}
+    : {result: request.spec, stderr: ["WARN test-warning"]};
+  process.stdout.write(JSON.stringify(response) + "\\n");
+});
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_node_worker_transport(
+    tmp_path: pathlib.Path, monkeypatch: MonkeyPatch, capsys: SysCapture
+) -> None:
+    driver = tmp_path / "driver.js"
+    driver.write_text(ECHO_DRIVER)
+    monkeypatch.setattr(_node._NodeWorker, "_DRIVER", str(driver))
+    worker = _node._NodeWorker()
+    try:
+        assert worker.call("echo", {"a": 1}) == {"a": 1}
+        assert "WARN test-warning" in capsys.readouterr().err
+
+        assert worker.call("echo", {"a": 2}, stderr_filter=lambda line: False) == {
+            "a": 2
+        }
+        assert "WARN test-warning" not in capsys.readouterr().err
+
+        with pytest.raises(_node.subprocess.CalledProcessError):
+            worker.call("fail", {})
+
+        specs: List[JSONDict] = [{"a": i} for i in range(10)]
+        assert worker.call_many("echo", specs) == specs
+    finally:
+        worker.stop()
+
+
+# Stub node modules used to drive the real vega_worker.js through the
+# MessagePack upgrade without requiring the vega npm packages. The codec is a
+# minimal but genuine msgpack implementation covering the types the worker
+# protocol exchanges.
+MSGPACK_STUB = """
+function encode(value) {
+  const parts = [];
+  enc(value, parts);
+  return Buffer.concat(parts);
+}
+function enc(v, parts) {
+  if (v === null || v === undefined) {
+    parts.push(Buffer.from([0xc0]));
+  } else if (typeof v === "boolean") {
+    parts.push(Buffer.from([v ? 0xc3 : 0xc2]));
+  } else if (Number.isInteger(v) && v >= 0 && v <= 0xffffffff) {
+    if (v < 0x80) {
+      parts.push(Buffer.from([v]));
+    } else {
+      const b = Buffer.alloc(5);
+      b[0] = 0xce;
+      b.writeUInt32BE(v, 1);
+      parts.push(b);
+    }
+  } else if (typeof v === "string") {
+    const s = Buffer.from(v, "utf8");
+    const b = Buffer.alloc(3);
+    b[0] = 0xda;
+    b.writeUInt16BE(s.length, 1);
+    parts.push(b, s);
+  } else if (Buffer.isBuffer(v)) {
+    const b = Buffer.alloc(5);
+    b[0] = 0xc6;
+    b.writeUInt32BE(v.length, 1);
+    parts.push(b, v);
+  } else if (Array.isArray(v)) {
+    if (v.length >= 16) throw new Error("array too long for stub");
+    parts.push(Buffer.from([0x90 | v.length]));
+    for (const item of v) enc(item, parts);
+  } else if (typeof v === "object") {
+    const keys = Object.keys(v);
+    if (keys.length >= 16) throw new Error("map too large for stub");
+    parts.push(Buffer.from([0x80 | keys.length]));
+    for (const k of keys) {
+      enc(k, parts);
+      enc(v[k], parts);
+    }
+  } else {
+    throw new Error("unsupported type: " + typeof v);
+  }
+}
+function decode(buf) {
+  return dec({buf: buf, pos: 0});
+}
+function dec(s) {
+  const t = s.buf[s.pos++];
+  if (t < 0x80) return t;
+  if ((t & 0xf0) === 0x80) return decMap(s, t & 0x0f);
+  if ((t & 0xf0) === 0x90) return decArray(s, t & 0x0f);
+  if ((t & 0xe0) === 0xa0) return decStr(s, t & 0x1f);
+  if (t === 0xc0) return null;
+  if (t === 0xc2) return false;
+  if (t === 0xc3) return true;
+  if (t === 0xcc) return s.buf[s.pos++];
+  if (t === 0xcd) return decUInt(s, 2);
+  if (t === 0xce) return decUInt(s, 4);
+  if (t === 0xd9) return decStr(s, s.buf[s.pos++]);
+  if (t === 0xda) return decStr(s, decUInt(s, 2));
+  if (t === 0xdc) return decArray(s, decUInt(s, 2));
+  if (t === 0xde) return decMap(s, decUInt(s, 2));
+  throw new Error("unsupported msgpack type: 0x" + t.toString(16));
+}
+function decUInt(s, n) {
+  const v = s.buf.readUIntBE(s.pos, n);
+  s.pos += n;
+  return v;
+}
+function decStr(s, n) {
+  const v = s.buf.toString("utf8", s.pos, s.pos + n);
+  s.pos += n;
+  return v;
+}
+function decMap(s, n) {
+  const obj = {};
+  for (let i = 0; i < n; i++) {
+    const k = dec(s);
+    obj[k] = dec(s);
+  }
+  return obj;
+}
+function decArray(s, n) {
+  const arr = [];
+  for (let i = 0; i < n; i++) arr.push(dec(s));
+  return arr;
+}
+module.exports = {encode: encode, decode: decode};
+"""
+
+VEGA_STUB = """
+class View {
+  constructor(spec, options) {
+    this.spec = spec;
+  }
+  finalize() {
+    return this;
+  }
+  toSVG() {
+    return Promise.resolve("<svg>" + JSON.stringify(this.spec) + "</svg>");
+  }
+  toCanvas() {
+    return Promise.resolve({toBuffer: () => Buffer.from([137, 80, 78, 71])});
+  }
+}
+module.exports = {Warn: 2, parse: (spec) => spec, View: View};
+"""
+
+VEGA_LITE_STUB = """
+module.exports = {compile: (spec, options) => ({spec: spec})};
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+@pytest.mark.skipif(_node.msgpack is None, reason="msgpack is not installed")
+def test_node_worker_msgpack_upgrade(
+    tmp_path: pathlib.Path, monkeypatch: MonkeyPatch
+) -> None:
+    # Drive the real vega_worker.js through the msgpack upgrade end to end,
+    # with stub vega modules standing in for the npm packages.
+    mods = tmp_path / "node_modules"
+    for name, source in [
+        ("msgpack-lite", MSGPACK_STUB),
+        ("vega", VEGA_STUB),
+        ("vega-lite", VEGA_LITE_STUB),
+    ]:
+        (mods / name).mkdir(parents=True)
+        (mods / name / "index.js").write_text(source)
+    monkeypatch.setattr(_node, "npm_root", lambda global_: str(mods))
+
+    worker = _node._NodeWorker()
+    try:
+        worker.warm_up()
+        assert worker._msgpack
+
+        assert worker.call("vl2vg", {"a": 1}) == {"a": 1}
+        assert worker.call("vg2svg", {"a": 1}) == '<svg>{"a":1}</svg>'
+        # Binary results arrive as raw bytes, with no base64 step.
+        assert worker.call("vg2png", {"a": 1}) == b"\x89PNG"
+
+        specs: List[JSONDict] = [{"i": i} for i in range(10)]
+        assert worker.call_many("vl2vg", specs) == specs
+    finally:
+        worker.stop()
+
+
+@pytest.mark.skipif(_node.msgpack is None, reason="msgpack is not installed")
+def test_node_worker_msgpack_framing() -> None:
+    worker = _node._NodeWorker()
+    worker._msgpack = True
+    buf = io.BytesIO()
+    worker._write_message(buf, {"op": "vl2vg", "spec": {"a": 1}})
+    worker._write_message(buf, {"op": "vg2svg", "spec": {"b": [2, 3]}})
+    buf.seek(0)
+    assert worker._read_message(buf) == {"op": "vl2vg", "spec": {"a": 1}}
+    assert worker._read_message(buf) == {"op": "vg2svg", "spec": {"b": [2, 3]}}
+    assert worker._read_message(buf) is None
+
+
 @pytest.mark.parametrize("suppress_warnings", [True, False])
 def test_stderr_suppression(
     interactive_spec: JSONDict, suppress_warnings: bool, capsys: SysCapture,
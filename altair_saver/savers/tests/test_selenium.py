@@ -1,7 +1,8 @@
 import io
 import json
 import os
-from typing import Any, Dict, IO, Iterator, Tuple
+from typing import Any, Dict, IO, Iterator, List, Tuple
+from urllib.request import urlopen
 
 import altair as alt
 import pandas as pd
@@ -95,6 +96,73 @@ def test_stop_and_start(name: str, data: Dict[str, Any]) -> None:
     assert bundle1 == bundle2
 
 
+class _FakeDriver:
+    """A stand-in webdriver that records page loads and script executions."""
+
+    def __init__(self) -> None:
+        self.page_loads = 0
+        self.script_executions = 0
+
+    def get(self, url: str) -> None:
+        if url != "about:blank":
+            self.page_loads += 1
+
+    def find_element_by_id(self, id_: str) -> object:
+        return object()
+
+    def execute_script(self, code: str) -> bool:
+        return True
+
+    def execute_async_script(
+        self, code: str, spec: JSONDict, fmt: str
+    ) -> Dict[str, Any]:
+        self.script_executions += 1
+        return {"result": f"<svg>{json.dumps(spec)}</svg>"}
+
+
+def test_save_many_loads_page_once(monkeypatch: MonkeyPatch) -> None:
+    driver = _FakeDriver()
+    monkeypatch.setattr(SeleniumSaver._registry, "get", lambda wd, timeout: driver)
+    monkeypatch.setattr(SeleniumSaver, "_select_webdriver", lambda *args: "chrome")
+    monkeypatch.setattr(
+        SeleniumSaver, "_serve", staticmethod(lambda content, js: "http://localhost/")
+    )
+    monkeypatch.setattr(SeleniumSaver, "_last_loaded", None)
+
+    specs: List[JSONDict] = [{"mark": "point"}, {"mark": "line"}, {"mark": "bar"}]
+    results = SeleniumSaver.save_many(specs, fmt="svg")
+
+    assert results == [f"<svg>{json.dumps(spec)}</svg>" for spec in specs]
+    assert driver.page_loads == 1
+    assert driver.script_executions == len(specs)
+
+    # A second batch served at the same URL reuses the already-loaded page.
+    SeleniumSaver.save_many(specs, fmt="svg")
+    assert driver.page_loads == 1
+    assert driver.script_executions == 2 * len(specs)
+
+
+def test_serve_caching() -> None:
+    try:
+        url1 = SeleniumSaver._serve("<html>one</html>", {})
+        assert SeleniumSaver._serve("<html>one</html>", {}) == url1
+        assert urlopen(url1).read() == b"<html>one</html>"
+
+        # Serving new content replaces the page at the root URL, so a driver
+        # sitting on it must be forced to re-navigate.
+        SeleniumSaver._last_loaded = (object(), url1)  # type: ignore[assignment]
+        url2 = SeleniumSaver._serve("<html>two</html>", {})
+        assert urlopen(url2).read() == b"<html>two</html>"
+        assert SeleniumSaver._last_loaded is None
+
+        # Serving earlier content again must refresh the resource.
+        url3 = SeleniumSaver._serve("<html>one</html>", {})
+        assert urlopen(url3).read() == b"<html>one</html>"
+    finally:
+        SeleniumSaver._stop_serving()
+    assert SeleniumSaver._last_served is None
+
+
 @pytest.mark.parametrize("enabled", [True, False])
 def test_enabled(monkeypatch: MonkeyPatch, enabled: bool) -> None:
     monkeypatch.setattr(
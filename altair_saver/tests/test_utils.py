@@ -1,3 +1,4 @@
+import asyncio
 import http
 import io
 import socket
@@ -18,6 +19,8 @@ from altair_saver._utils import (
     mimetype_to_fmt,
     temporary_filename,
     check_output_with_stderr,
+    check_output_with_stderr_async,
+    run_coro_sync,
 )
 
 
@@ -157,3 +160,52 @@ def test_check_output_with_stderr(
         assert captured.err == "second error\n"
     else:
         assert captured.err == "first error\nsecond error\n"
+
+
+def test_run_coro_sync() -> None:
+    async def coro() -> int:
+        await asyncio.sleep(0)
+        return 42
+
+    # Without a running loop, the coroutine runs on the calling thread.
+    assert run_coro_sync(coro()) == 42
+
+    # With a running loop, it is offloaded rather than raising RuntimeError.
+    async def outer() -> int:
+        return run_coro_sync(coro())
+
+    assert asyncio.run(outer()) == 42
+
+
+@pytest.mark.parametrize("cmd_error", [True, False])
+@pytest.mark.parametrize("use_filter", [True, False])
+def test_check_output_with_stderr_async(
+    capsys: SysCapture, use_filter: bool, cmd_error: bool
+) -> None:
+    cmd = r'>&2 echo "first error\nsecond error" && echo "the output"'
+    stderr_filter = None if not use_filter else lambda line: line.startswith("second")
+
+    if cmd_error:
+        cmd += r" && exit 1"
+        with pytest.raises(subprocess.CalledProcessError) as err:
+            asyncio.run(
+                check_output_with_stderr_async(
+                    ["sh", "-c", cmd], stderr_filter=stderr_filter
+                )
+            )
+        assert err.value.stderr == b"first error\nsecond error\n"
+    else:
+        output = asyncio.run(
+            check_output_with_stderr_async(
+                ["sh", "-c", cmd], stderr_filter=stderr_filter
+            )
+        )
+        assert output == b"the output\n"
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+
+    if use_filter:
+        assert captured.err == "second error\n"
+    else:
+        assert captured.err == "first error\nsecond error\n"
@@ -66,6 +66,7 @@ setup(
     license="MIT",
     packages=find_packages(),
     include_package_data=True,
+    package_data={"altair_saver": ["js/*.js"]},
     install_requires=get_install_requirements("requirements.txt"),
     entry_points={
         "altair.vegalite.v4.renderer": ["altair_saver=altair_saver:render"],